@@ -6,6 +6,11 @@ import random
 from util import Direction, HoleTile
 from loading import get_board
 
+# A single shared list with hole tile for coordinates out of the board.
+# The tile has no state of its own, so get_tiles() can return the same
+# list every time instead of creating a new HoleTile on every lookup.
+OUT_OF_BOARD_TILES = [HoleTile(Direction.N, None, [])]
+
 
 class Robot:
     def __init__(self, direction, path, path_front, coordinates):
@@ -107,7 +112,7 @@ class State:
         else:
             # Coordinates are out of game board.
             # Return hole tile.
-            return [HoleTile(Direction.N, None, [])]
+            return OUT_OF_BOARD_TILES
 
 
 def get_starting_coordinates(board):
@@ -10,6 +10,28 @@ import pyglet
 TILE_WIDTH = 64
 TILE_HEIGHT = 64
 
+# Dictionary of already loaded images with path as a key.
+# Images are reused between frames so every file is read from disk only once.
+loaded_images = {}
+
+
+def get_image(path):
+    """
+    Return a loaded image for the given path.
+
+    path: path to the image file
+
+    The image is loaded from disk only on the first request,
+    then it is taken from the loaded_images dictionary.
+    """
+    path = str(path)
+    if path not in loaded_images:
+        img = pyglet.image.load(path)
+        img.anchor_x = img.width//2
+        img.anchor_y = img.height//2
+        loaded_images[path] = img
+    return loaded_images[path]
+
 
 def init_window(state):
     """
@@ -62,9 +84,7 @@ def create_sprites(coordinate, items):
         rotation = item.direction.value
         path = item.path
         x, y = coordinate
-        img = pyglet.image.load(path)
-        img.anchor_x = img.width//2
-        img.anchor_y = img.height//2
+        img = get_image(path)
         item_x = x*TILE_WIDTH
         item_y = y*TILE_HEIGHT
         img_sprite = pyglet.sprite.Sprite(img, x=img.anchor_x + item_x,
@@ -4,13 +4,26 @@ Loading module contains functions to load map file exported to json format from
 from util import Direction, select_tile
 import json
 
+# The orjson library decodes JSON several times faster than the standard
+# json module. It is optional - without it the standard module is used.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def get_data(map_name):
     """
     Return a dictionary of decoded JSON map file.
 
     map_name: a map of the game board created in Tiled 1.2 and saved as a JSON file
+
+    Use the orjson library for decoding if it is installed,
+    otherwise fall back to the standard json module.
     """
+    if orjson is not None:
+        with open(map_name, "rb") as map_file:
+            return orjson.loads(map_file.read())
     with open(map_name, encoding="utf-8") as map_file:
         data = json.load(map_file)
     return data
@@ -285,12 +285,14 @@ class Direction(Enum):
 
         Change attribute direction according to argument where_to, passed from TDB class DirectionOfRotation.
         """
-        if where_to == "right":
-            return Direction((self.value + 90) % 360)
-        if where_to == "left":
-            return Direction((self.value + 270) % 360)
-        if where_to == "upside_down":
-            return Direction((self.value + 180) % 360)
+        return Direction((self.value + ROTATION_DEGREES[where_to]) % 360)
+
+
+
+# Count of degrees for every direction of rotation.
+# Used by Direction.get_new_direction() as a single dictionary lookup
+# instead of comparing the where_to argument with every known rotation.
+ROTATION_DEGREES = {"right": 90, "left": 270, "upside_down": 180}
 
 
 